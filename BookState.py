@@ -11,11 +11,17 @@ class BookState:
         borrowers (dict): Maps student_id -> number of copies currently borrowed by that student.
     """
 
+    __slots__ = ("total", "borrowed_count", "reservations", "borrowers")
+
     def __init__(self):
         """
         Initialize a new BookState with default values.
         """
         self.total = 0           # Total copies held by the library
         self.borrowed_count = 0        # Copies currently lent out
+        # deque rather than a pure-Python ring buffer: its append/popleft are single C
+        # calls, whereas a Python ring pays a method frame per operation.
         self.reservations = deque()     # Pending reservations in FIFO order
+        # A dict even for titles with only a few borrowers: one C-level dict probe is
+        # cheaper than any Python-level scan over a small flat list.
         self.borrowers = {}             # student_id -> count of borrowed copies
\ No newline at end of file
@@ -1,10 +1,63 @@
+from bisect import insort
+
 from BookState import BookState
 from Shelf import Shelf
 
+# A copy is lent only while at least this many are available, so one always stays on hand.
+_MIN_AVAILABLE_TO_LEND = 2
+
+
+def _can_lend(book_state: BookState) -> bool:
+    """
+    Lending policy: nobody is queued and at least _MIN_AVAILABLE_TO_LEND copies are free.
+    Library.borrow_book inlines this check, and Library._fulfill_reservations applies
+    the same threshold to queued students; all three read _MIN_AVAILABLE_TO_LEND.
+
+    Args:
+        book_state (BookState): The state object for the title.
+
+    Returns:
+        bool: True if one copy may be lent right now.
+    """
+    return (not book_state.reservations
+            and book_state.total - book_state.borrowed_count >= _MIN_AVAILABLE_TO_LEND)
+
+
+class _BookTable(dict):
+    """
+    Maps book_id -> BookState, registering unknown titles on first subscript.
+
+    Plain subscripting is handled by dict in C; only a miss calls __missing__,
+    which creates the BookState and records the new title in sorted_ids.
+    .get() never registers a title, so lookup-only paths stay side-effect free.
+    """
+
+    __slots__ = ("sorted_ids",)
+
+    def __init__(self):
+        super().__init__()
+        self.sorted_ids = []            # Known book_ids in sorted order
+
+    def __missing__(self, book_id: str) -> BookState:
+        # Index first: if book_id cannot be ordered against the known ids, insort
+        # raises before the table is touched and the title is not registered.
+        insort(self.sorted_ids, book_id)
+        book_state = self[book_id] = BookState()
+        return book_state
+
 
 class Library:
     """
     Core library management system for tracking books, borrowers, and shelf display order..
+
+    All book_ids must be mutually comparable (e.g. all str), since titles are kept
+    in sorted order as they are registered. A book_id that cannot be ordered against
+    the known ones raises TypeError and is not recorded.
+
+    A Library is not safe to share between threads without external locking.
+    Individual deque and dict operations are atomic, including on free-threaded
+    builds, but borrow/return/add are check-then-act sequences across several of
+    them, so callers must serialize operations on one instance.
     """
 
     def __init__(self, shelf_capacity: int):
@@ -14,8 +67,14 @@ class Library:
         Args:
             shelf_capacity (int): Maximum number of books the shelf can display at once.
         """
-        self._books = {}                # Maps book_id -> BookState
+        self._books = _BookTable()      # Maps book_id -> BookState
+        self._sorted_ids = self._books.sorted_ids  # Known book_ids in sorted order
         self._shelf = Shelf(shelf_capacity)
+        # Shelf operations bound once here, so hot paths call straight into the
+        # shelf instead of going through a forwarding method on every use.
+        self._shelf_contains = self._shelf.contains          # book_id -> bool
+        self._shelf_add_to_front = self._shelf.add_to_front  # book_id -> evicted book_id | None
+        self._shelf_front = self._shelf.front                # () -> front book_id | None
 
     def _touch_book(self, book_id: str) -> BookState:
         """
@@ -27,91 +86,49 @@ class Library:
         Returns:
             BookState: The corresponding BookState object, newly created if absent.
         """
-        book_state = self._books.get(book_id)
-        if book_state is None:
-            book_state = BookState()
-            self._books[book_id] = book_state
-        return book_state
+        return self._books[book_id]
 
-    def _available_copies(self, book_id: str) -> int:
+    def _fulfill_reservations(self, book_id: str, book_state: BookState) -> None:
         """
-        Compute the number of currently available (non-borrowed) copies of a book.
+        Lend copies to waiting students in FIFO order while policy allows it.
 
         Args:
             book_id (str): Unique identifier for the book.
-
-        Returns:
-            int: The number of available copies. Returns 0 if the book is unknown.
-        """
-        book_state = self._books.get(book_id)
-        if not book_state:
-            return 0
-        return book_state.total - book_state.borrowed_count
-
-    def _shelf_contains(self, book_id: str) -> bool:
-        """
-        Check whether a given book is currently displayed on the shelf.
-
-        Args:
-            book_id (str): Unique identifier for the book.
-
-        Returns:
-            bool: True if the book is on the shelf, otherwise False.
-        """
-        return self._shelf.contains(book_id)
-
-    def _shelf_move_to_front(self, book_id: str) -> None:
-        """
-        Move an existing book on the shelf to the front position,
-        marking it as the most recently interacted-with title.
-
-        Args:
-            book_id (str): Unique identifier for the book.
-        """
-        self._shelf.move_to_front(book_id)
-
-    def _shelf_add_to_front(self, book_id: str) -> str | None:
-        """
-        Add a book to the front of the shelf, evicting the least recent one if capacity is full.
-
-        Args:
-            book_id (str): Unique identifier for the book.
-
-        Returns:
-            str | None: The ID of any evicted book, or None if none was removed.
-        """
-        return self._shelf.add_to_front(book_id)
-
-    def _shelf_front(self) -> str | None:
-        """
-        Retrieve the book currently at the front of the shelf.
-
-        Returns:
-            str | None: The book_id at the highest-priority position, or None if the shelf is empty.
-        """
-        return self._shelf.front()
+            book_state (BookState): The state object for book_id.
+        """
+        reservations = book_state.reservations
+        free = book_state.total - book_state.borrowed_count
+        if not reservations or free < _MIN_AVAILABLE_TO_LEND:
+            return
+        borrowers = book_state.borrowers
+        while reservations and free >= _MIN_AVAILABLE_TO_LEND:
+            student_id = reservations.popleft()
+            borrowers[student_id] = borrowers.get(student_id, 0) + 1
+            free -= 1
+        book_state.borrowed_count = book_state.total - free
+        # Every fulfillment would promote the same title, so one shelf update suffices.
+        self._shelf_add_to_front(book_id)
 
     def add_books(self, add_list: list[tuple[str, int]]) -> None:
         """
         Increase stock for the given titles.
         Input: A list of (book_id, q), where q represents the number of copies to be added (q ≥ 0).
         Output: None.
+
+        Quantities for a title listed more than once are summed first, so each title
+        is stocked and has its reservations drained once, in order of first appearance.
         """
+        added = {}
         for book_id, q in add_list:
             if q < 0:
                 continue
+            added[book_id] = added.get(book_id, 0) + q
 
+        for book_id, q in added.items():
             book_state = self._touch_book(book_id)
             book_state.total += q
 
-            while book_state.reservations and self._available_copies(book_id) >= 2:
-                student_id = book_state.reservations.popleft()
-                book_state.borrowed_count += 1
-                book_state.borrowers[student_id] = book_state.borrowers.get(student_id, 0) + 1
-                if self._shelf_contains(book_id):
-                    self._shelf_move_to_front(book_id)
-                else:
-                    self._shelf_add_to_front(book_id)
+            self._fulfill_reservations(book_id, book_state)
 
     def query_book_inventory(self) -> list[tuple[str, int]]:
         """
@@ -119,12 +136,8 @@ class Library:
         Input: None.
         Output: A list of (book_id, total) for all known titles.
         """
-        book_inventory = [
-            (book_id, self._books[book_id].total)
-            for book_id in self._books
-        ]
-        book_inventory.sort(key=lambda x: x[0])
-        return book_inventory
+        books = self._books
+        return [(book_id, books[book_id].total) for book_id in self._sorted_ids]
 
     def is_available(self, book_id: str) -> bool:
         """
@@ -135,9 +148,7 @@ class Library:
         book_state = self._books.get(book_id)
         if not book_state:
             return False
-        if book_state.reservations:
-            return False
-        return self._available_copies(book_id) >= 2
+        return _can_lend(book_state)
 
     def borrow_book(self, book_id: str, student_id: str) -> bool:
         """
@@ -147,7 +158,9 @@ class Library:
         otherwise False and put the reservation on hold.
         """
         book_state = self._touch_book(book_id)
-        if self.is_available(book_id):
+        # Inlined _can_lend(book_state) to keep a call frame off the borrow path.
+        if (not book_state.reservations
+                and book_state.total - book_state.borrowed_count >= _MIN_AVAILABLE_TO_LEND):
             book_state.borrowed_count += 1
             book_state.borrowers[student_id] = book_state.borrowers.get(student_id, 0) + 1
             self._shelf_add_to_front(book_id)
@@ -177,11 +190,7 @@ class Library:
 
         book_state.borrowed_count -= 1
 
-        while book_state.reservations and self._available_copies(book_id) >= 2:
-            next_student = book_state.reservations.popleft()
-            book_state.borrowed_count += 1
-            book_state.borrowers[next_student] = book_state.borrowers.get(next_student, 0) + 1
-            self._shelf_add_to_front(book_id)
+        self._fulfill_reservations(book_id, book_state)
 
         return True
 
@@ -1,3 +1,6 @@
+from collections import OrderedDict
+
+
 class Shelf:
     """
     Represents the physical display shelf in the library.
@@ -6,22 +9,15 @@ class Shelf:
     Titles at the front are considered higher priority (more prominently displayed).
     When a book is borrowed, it is treated as renewed interest and moved to the front.
 
+    The ordering is kept in an OrderedDict, whose doubly linked list and lookup table
+    are implemented in C. The last key is the front of the shelf and the first key is
+    the back, so promotion is move_to_end() and eviction is popitem(last=False).
+
     Attributes:
         capacity (int): Maximum number of distinct titles the shelf can hold.
-        _map (dict): Maps book_id -> node for O(1) lookup.
-        _head (_Node): Sentinel node representing the front of the shelf.
-        _tail (_Node): Sentinel node representing the back of the shelf.
+        _map (OrderedDict): book_id -> None, ordered from back to front.
     """
 
-    class _Node:
-        """Internal node used for doubly linked list order tracking."""
-        __slots__ = ("book_id", "prev", "next")
-
-        def __init__(self, book_id=None):
-            self.book_id = book_id
-            self.prev = None
-            self.next = None
-
     def __init__(self, capacity: int):
         """
         Initialize a Shelf with a maximum capacity.
@@ -30,31 +26,47 @@ class Shelf:
             capacity (int): Maximum number of books the shelf can hold.
         """
         self.capacity = int(capacity)     # Maximum capacity of the shelf
-        self._map = {}                    # book_id -> _Node
-        self._head = self._Node()         # Sentinel node for front
-        self._tail = self._Node()         # Sentinel node for back
-        self._head.next = self._tail
-        self._tail.prev = self._head
-
-    def _add_front(self, node):
-        """Insert node directly after head (front position)."""
-        node.prev = self._head
-        node.next = self._head.next
-        self._head.next.prev = node
-        self._head.next = node
-
-    def _remove(self, node):
-        """Detach a node from the linked list."""
-        node.prev.next = node.next
-        node.next.prev = node.prev
-
-    def _pop_back(self):
-        """Remove and return the node at the back (lowest priority)."""
-        if self._tail.prev is self._head:
+        self._map = OrderedDict()         # book_id -> None, back to front
+
+        # Degenerate capacities get their operations bound once here, so the
+        # general methods never re-check for them.
+        if self.capacity == 0:
+            self.contains = self._never_contains
+            self.move_to_front = self._ignore
+            self.add_to_front = self._ignore
+            self.front = self._no_front
+        elif self.capacity == 1:
+            self.move_to_front = self._ignore
+            self.add_to_front = self._add_to_front_single
+            self.front = self._front_single
+
+    @staticmethod
+    def _ignore(book_id):
+        """No-op shelf update; returns None as add_to_front does when nothing is evicted."""
+        return None
+
+    @staticmethod
+    def _never_contains(book_id):
+        """contains() for a zero-capacity shelf."""
+        return False
+
+    @staticmethod
+    def _no_front():
+        """front() for a zero-capacity shelf."""
+        return None
+
+    def _add_to_front_single(self, book_id):
+        """add_to_front() for a one-slot shelf: replace the held title unless it matches."""
+        shelf = self._map
+        if book_id in shelf:
             return None
-        node = self._tail.prev
-        self._remove(node)
-        return node
+        evicted = shelf.popitem()[0] if shelf else None
+        shelf[book_id] = None
+        return evicted
+
+    def _front_single(self):
+        """front() for a one-slot shelf, where the only title is the front."""
+        return next(iter(self._map), None)
 
     def contains(self, book_id):
         """Return True if the book is currently on the shelf."""
@@ -65,11 +77,8 @@ class Shelf:
         Move an existing title to the front of the shelf.
         Does nothing if the title is not on the shelf.
         """
-        node = self._map.get(book_id)
-        if not node:
-            return
-        self._remove(node)
-        self._add_front(node)
+        if book_id in self._map:
+            self._map.move_to_end(book_id)
 
     def add_to_front(self, book_id):
         """
@@ -78,41 +87,27 @@ class Shelf:
         If the title already exists, simply move it to the front.
         Returns the evicted book_id if one was removed, otherwise None.
         """
-        if self.capacity == 0:
-            return None
-
-        if book_id in self._map:
-            self.move_to_front(book_id)
+        shelf = self._map
+        if book_id in shelf:
+            shelf.move_to_end(book_id)
             return None
 
         evicted = None
-        if len(self._map) == self.capacity:
-            back_node = self._pop_back()
-            if back_node:
-                evicted = back_node.book_id
-                del self._map[evicted]
-
-        node = self._Node(book_id)
-        self._add_front(node)
-        self._map[book_id] = node
+        if len(shelf) == self.capacity:
+            evicted = shelf.popitem(last=False)[0]
+        shelf[book_id] = None
         return evicted
 
     def remove_back(self):
         """Remove and return the title at the back of the shelf (lowest priority)."""
-        back_node = self._pop_back()
-        if not back_node:
+        if not self._map:
             return None
-        evicted = back_node.book_id
-        del self._map[evicted]
-        return evicted
+        return self._map.popitem(last=False)[0]
 
     def front(self):
         """Return the book_id currently at the front of the shelf, or None if empty."""
-        first_node = self._head.next
-        if first_node is self._tail:
-            return None
-        return first_node.book_id
+        return next(reversed(self._map), None)
 
     def __len__(self):
         """Return the number of distinct titles currently on the shelf."""
-        return len(self._map)
\ No newline at end of file
+        return len(self._map)
@@ -0,0 +1,130 @@
+"""
+Microbenchmark for the Library hot paths.
+
+Reports nanoseconds per operation for the workloads PERFORMANCE.md refers to.
+
+    python bench.py                  print ns/op per workload
+    python bench.py --save           record the current numbers as the baseline
+    python bench.py --check          exit 1 if a workload regresses (see below)
+
+--check fails when a workload exceeds its CEILING_NS entry, or when a baseline
+file exists and a workload is more than TOLERANCE times its recorded value.
+For instruction counts use `perf stat -e instructions python bench.py`.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import timeit
+
+from Library import Library
+
+OPS = 50_000
+REPEAT = 7
+BASELINE = "bench_baseline.json"
+TOLERANCE = 1.5                  # Allowed slowdown against the recorded baseline
+
+
+def _borrow_return_steady():
+    """Borrow then return across a warm catalogue; no reservations pile up."""
+    rnd = random.Random(1)
+    pairs = [(f"b{rnd.randrange(200)}", f"s{rnd.randrange(50)}") for _ in range(OPS)]
+    library = Library(20)
+    library.add_books([(f"b{i}", 3) for i in range(200)])
+
+    def run():
+        for book_id, student_id in pairs:
+            if library.borrow_book(book_id, student_id):
+                library.return_book(book_id, student_id)
+    return run, 2 * OPS
+
+
+def _reservation_drain():
+    """One waiting student fulfilled on every return: the common drain size."""
+    library = Library(5)
+    library.add_books([("a", 2)])
+    library.borrow_book("a", "s0")
+
+    def run():
+        for _ in range(OPS // 4):
+            library.borrow_book("a", "s1")
+            library.return_book("a", "s0")
+            library.borrow_book("a", "s0")
+            library.return_book("a", "s1")
+    return run, OPS
+
+
+def _inventory_query():
+    """Sorted inventory snapshot over 1000 titles."""
+    library = Library(20)
+    library.add_books([(f"b{i}", 1) for i in range(1000)])
+
+    def run():
+        for _ in range(OPS // 1000):
+            library.query_book_inventory()
+    return run, OPS // 1000
+
+
+WORKLOADS = {
+    "borrow/return steady state": _borrow_return_steady,
+    "reservation drain (batch of 1)": _reservation_drain,
+    "query_book_inventory (1000 titles)": _inventory_query,
+}
+
+# Machine-independent backstop: roughly 5x the CPython 3.11 numbers at the time
+# these were set, so only gross regressions trip it on ordinary hardware.
+CEILING_NS = {
+    "borrow/return steady state": 2_500,
+    "reservation drain (batch of 1)": 2_000,
+    "query_book_inventory (1000 titles)": 500_000,
+}
+
+
+def measure() -> dict[str, float]:
+    """Run every workload and return the best ns/op for each."""
+    results = {}
+    for name, make in WORKLOADS.items():
+        run, ops = make()
+        best = min(timeit.repeat(run, number=1, repeat=REPEAT))
+        results[name] = best / ops * 1e9
+    return results
+
+
+def check(results: dict[str, float], baseline_path: str) -> list[str]:
+    """Return a description of every workload that breaches a ceiling or the baseline."""
+    failures = []
+    for name, ns in results.items():
+        if ns > CEILING_NS[name]:
+            failures.append(f"{name}: {ns:.0f} ns/op exceeds ceiling {CEILING_NS[name]} ns/op")
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        for name, ns in results.items():
+            recorded = baseline.get(name)
+            if recorded is not None and ns > recorded * TOLERANCE:
+                failures.append(
+                    f"{name}: {ns:.0f} ns/op is over {TOLERANCE}x baseline {recorded:.0f} ns/op"
+                )
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Library hot-path microbenchmark")
+    parser.add_argument("--save", action="store_true", help="record results as the baseline")
+    parser.add_argument("--check", action="store_true", help="exit 1 on a regression")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file path")
+    args = parser.parse_args()
+
+    results = measure()
+    for name, ns in results.items():
+        print(f"{name:<36} {ns:>10.0f} ns/op")
+
+    if args.save:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.check:
+        failures = check(results, args.baseline)
+        for failure in failures:
+            print("REGRESSION:", failure, file=sys.stderr)
+        sys.exit(1 if failures else 0)
@@ -0,0 +1,138 @@
+import unittest
+
+from Library import Library
+from Shelf import Shelf
+
+
+class ShelfTest(unittest.TestCase):
+    """Recency ordering and eviction across the specialized and general shelves."""
+
+    def test_capacity_zero_holds_nothing(self):
+        shelf = Shelf(0)
+        self.assertIsNone(shelf.add_to_front("a"))
+        shelf.move_to_front("a")
+        self.assertFalse(shelf.contains("a"))
+        self.assertIsNone(shelf.front())
+        self.assertIsNone(shelf.remove_back())
+        self.assertEqual(len(shelf), 0)
+
+    def test_capacity_one_replaces_the_only_title(self):
+        shelf = Shelf(1)
+        self.assertIsNone(shelf.add_to_front("a"))
+        self.assertIsNone(shelf.add_to_front("a"))
+        self.assertEqual(shelf.add_to_front("b"), "a")
+        shelf.move_to_front("b")
+        self.assertEqual(shelf.front(), "b")
+        self.assertFalse(shelf.contains("a"))
+        self.assertEqual(len(shelf), 1)
+        self.assertEqual(shelf.remove_back(), "b")
+        self.assertIsNone(shelf.front())
+
+    def test_capacity_n_evicts_least_recent(self):
+        shelf = Shelf(3)
+        for book_id in ("a", "b", "c"):
+            self.assertIsNone(shelf.add_to_front(book_id))
+        shelf.move_to_front("a")                 # order, front to back: a c b
+        self.assertIsNone(shelf.add_to_front("c"))  # c a b
+        self.assertEqual(shelf.add_to_front("d"), "b")  # d c a
+        self.assertEqual(shelf.front(), "d")
+        self.assertEqual(shelf.remove_back(), "a")
+        self.assertEqual(shelf.remove_back(), "c")
+        self.assertEqual(shelf.remove_back(), "d")
+        self.assertIsNone(shelf.remove_back())
+
+    def test_move_to_front_ignores_unknown_title(self):
+        shelf = Shelf(2)
+        shelf.add_to_front("a")
+        shelf.move_to_front("zz")
+        self.assertEqual(shelf.front(), "a")
+        self.assertEqual(len(shelf), 1)
+
+    def test_negative_capacity_never_evicts(self):
+        shelf = Shelf(-1)
+        for i in range(10):
+            self.assertIsNone(shelf.add_to_front(f"b{i}"))
+        self.assertEqual(len(shelf), 10)
+        self.assertEqual(shelf.remove_back(), "b0")
+
+
+class LibraryTest(unittest.TestCase):
+    """Lending policy, reservation draining and inventory reporting."""
+
+    def test_inventory_is_sorted_and_ignores_negative_quantities(self):
+        library = Library(2)
+        library.add_books([("c", 1), ("a", 2), ("b", -1), ("d", 0)])
+        library.add_books([("a", 1)])
+        self.assertEqual(library.query_book_inventory(), [("a", 3), ("c", 1), ("d", 0)])
+
+    def test_lending_keeps_one_copy_on_hand(self):
+        library = Library(2)
+        library.add_books([("a", 2)])
+        self.assertTrue(library.is_available("a"))
+        self.assertTrue(library.borrow_book("a", "s0"))
+        self.assertFalse(library.is_available("a"))
+        self.assertFalse(library.borrow_book("a", "s1"))
+        self.assertFalse(library.is_available("zz"))
+
+    def test_reservations_drain_in_fifo_order(self):
+        library = Library(2)
+        library.add_books([("a", 2)])
+        library.borrow_book("a", "s0")
+        self.assertFalse(library.borrow_book("a", "s1"))
+        self.assertFalse(library.borrow_book("a", "s2"))
+
+        self.assertTrue(library.return_book("a", "s0"))   # s1 is served; s2 still waits
+        self.assertFalse(library.return_book("a", "s2"))
+        self.assertTrue(library.return_book("a", "s1"))   # now s2 is served
+        self.assertTrue(library.return_book("a", "s2"))
+        self.assertFalse(library.return_book("a", "s2"))
+
+    def test_add_books_drains_waiting_students(self):
+        library = Library(2)
+        library.add_books([("a", 1)])
+        library.borrow_book("a", "s1")
+        library.borrow_book("a", "s2")
+        self.assertFalse(library.check_book_on_shelf("a"))
+
+        library.add_books([("a", 2)])                     # 3 free: serve s1 and s2
+        self.assertTrue(library.check_book_on_shelf("a"))
+        self.assertTrue(library.return_book("a", "s1"))
+        self.assertTrue(library.return_book("a", "s2"))
+
+    def test_repeated_titles_in_add_books_drain_once_in_first_appearance_order(self):
+        library = Library(3)
+        library.add_books([("a", 1), ("b", 1)])
+        library.borrow_book("a", "s1")
+        library.borrow_book("a", "s2")
+        library.borrow_book("b", "s3")
+
+        # "a" gets both copies in one drain and is promoted before "b", so "b"
+        # ends up at the front even though "a" is listed last.
+        library.add_books([("a", 1), ("b", 1), ("a", 1)])
+        self.assertEqual(library.check_highest_priority_book_on_shelf(), "b")
+        self.assertEqual(library.query_book_inventory(), [("a", 3), ("b", 2)])
+        self.assertTrue(library.return_book("a", "s2"))
+        self.assertTrue(library.return_book("b", "s3"))
+
+    def test_borrow_promotes_title_on_shelf(self):
+        library = Library(2)
+        library.add_books([("a", 3), ("b", 3), ("c", 3)])
+        library.borrow_book("a", "s")
+        library.borrow_book("b", "s")
+        library.borrow_book("a", "s")
+        self.assertEqual(library.check_highest_priority_book_on_shelf(), "a")
+        library.borrow_book("c", "s")                     # evicts b
+        self.assertFalse(library.check_book_on_shelf("b"))
+        self.assertTrue(library.check_book_on_shelf("a"))
+
+    def test_unorderable_book_id_is_not_registered(self):
+        library = Library(2)
+        library.add_books([("a", 3)])
+        with self.assertRaises(TypeError):
+            library.add_books([(7, 3)])
+        self.assertEqual(library.query_book_inventory(), [("a", 3)])
+        self.assertFalse(library.is_available(7))
+
+
+if __name__ == "__main__":
+    unittest.main()